@@ -22,17 +22,23 @@ if "bpy" in locals():
     import importlib
     if 'fspy' in locals():
         importlib.reload(fspy)  # type: ignore
+    if 'fspy_utils' in locals():
+        importlib.reload(fspy_utils)  # type: ignore
     if 'fspy_importer' in locals():
         importlib.reload(fspy_importer)  # type: ignore
     if 'fspy_properties' in locals():
         importlib.reload(fspy_properties)  # type: ignore
     if 'fspy_panel' in locals():
         importlib.reload(fspy_panel)  # type: ignore
+    if 'fspy_handlers' in locals():
+        importlib.reload(fspy_handlers)  # type: ignore
 
 from . import fspy
+from . import fspy_utils
 from . import fspy_importer
 from . import fspy_properties
 from . import fspy_panel
+from . import fspy_handlers
 
 
 def menu_func_import(self, context):
@@ -44,11 +50,13 @@ def register():
     fspy_properties.register()
     fspy_panel.register()
     fspy_importer.register()
+    fspy_handlers.register()
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
 
 
 def unregister():
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    fspy_handlers.unregister()
     fspy_importer.unregister()
     fspy_panel.unregister()
     fspy_properties.unregister()
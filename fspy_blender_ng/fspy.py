@@ -63,6 +63,7 @@ class Project:
     PART_SIZE_PACKER: typing.ClassVar[struct.Struct] = struct.Struct('<II')
 
     file_name: str
+    file_path: str
     image_data: bytes
     camera_parameters: CameraParameters
     reference_distance_unit: ReferenceDistanceUnit
@@ -70,6 +71,7 @@ class Project:
     def __init__(self, project_file_path: str) -> None:
         # Setup file name and open file.
         self.file_name = pathlib.Path(project_file_path).name
+        self.file_path = str(pathlib.Path(project_file_path).absolute())
         with open(project_file_path, 'rb') as project_file:
             # Check magic word at file header.
             gotten_magic_word = project_file.read(len(Project.MAGIC_WORD))
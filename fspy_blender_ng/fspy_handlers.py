@@ -0,0 +1,202 @@
+# fSpy Blender Importer
+# Copyright (C) 2018-2025 Per Gantelius, yyc12345
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import bpy
+import typing
+from . import fspy_properties
+from . import fspy_utils
+
+MarkerSignature = tuple[tuple[int, str | None], ...]
+
+
+class ResolutionTable:
+    """
+    The render resolution picked by timeline camera markers.
+
+    A `None` resolution means that marker switches to a camera not imported by fSpy.
+    """
+    signature: MarkerSignature
+    table: fspy_utils.CameraSwitchTable[tuple[int, int] | None]
+
+    def __init__(self, scene: bpy.types.Scene) -> None:
+        self.signature = get_marker_signature(scene)
+
+        markers: list[tuple[int, tuple[int, int] | None, bool]] = []
+        for marker in scene.timeline_markers:
+            camera_object = marker.camera
+            if camera_object is None or camera_object.hide_render:
+                markers.append((marker.frame, None, False))
+            else:
+                markers.append((marker.frame, get_camera_resolution(camera_object), True))
+        self.table = fspy_utils.CameraSwitchTable(markers)
+
+    def lookup(self, frame: int) -> tuple[int, int] | None:
+        """
+        Get the render resolution for given frame.
+        """
+        return self.table.lookup(frame)
+
+
+def get_marker_signature(scene: bpy.types.Scene) -> MarkerSignature:
+    """
+    Get a summary of timeline markers which is enough to tell whether resolution table is outdated.
+    """
+    return tuple(
+        (marker.frame, None if marker.camera is None else marker.camera.name)
+        for marker in scene.timeline_markers)
+
+
+def get_camera_resolution(camera_object: bpy.types.Object) -> tuple[int, int] | None:
+    """
+    Get the reference image resolution of given camera, or `None` if it is not imported by fSpy.
+    """
+    if camera_object.type != 'CAMERA':
+        return None
+    camera = typing.cast(bpy.types.Camera, camera_object.data)
+    camera_properties = fspy_properties.get_inner_fspy_properties(camera)
+    if not camera_properties.fspy_imported:
+        return None
+    return (camera_properties.image_resolution[0], camera_properties.image_resolution[1])
+
+
+# Resolution table of each scene, keyed by scene pointer.
+# They are built lazily and dropped once markers or cameras are changed.
+# Editing timeline markers does not always tag the scene in depsgraph, so marker changes are detected by:
+# message bus for moved or rebound markers, marker count for added or removed markers,
+# and a full marker signature check before rendering.
+resolution_tables: dict[int, ResolutionTable] = {}
+
+# The owner of our message bus subscriptions.
+msgbus_owner: object = object()
+
+
+def get_resolution_table(scene: bpy.types.Scene) -> ResolutionTable:
+    key = scene.as_pointer()
+    table = resolution_tables.get(key, None)
+    if table is None:
+        table = ResolutionTable(scene)
+        resolution_tables[key] = table
+    return table
+
+
+def apply_marker_resolution(scene: bpy.types.Scene) -> None:
+    """
+    Set the render resolution of given scene from the camera picked by timeline markers at current frame.
+    """
+    scene_properties = fspy_properties.get_fspy_scene_properties(scene)
+    if not scene_properties.auto_render_resolution:
+        return
+
+    resolution = get_resolution_table(scene).lookup(scene.frame_current)
+    if resolution is None:
+        return
+
+    # Only write if changed, to avoid useless depsgraph updates.
+    render_settings = scene.render
+    (w, h) = resolution
+    if render_settings.resolution_x != w:
+        render_settings.resolution_x = w
+    if render_settings.resolution_y != h:
+        render_settings.resolution_y = h
+
+
+def on_marker_changed() -> None:
+    resolution_tables.clear()
+
+
+def subscribe_marker_changes() -> None:
+    for prop_name in ('frame', 'camera'):
+        bpy.msgbus.subscribe_rna(
+            key=(bpy.types.TimelineMarker, prop_name),
+            owner=msgbus_owner,
+            args=(),
+            notify=on_marker_changed,
+        )
+
+
+@bpy.app.handlers.persistent
+def on_frame_change_pre(scene: bpy.types.Scene, *args) -> None:
+    # Check marker count to catch added or removed markers,
+    # which are not reported by message bus.
+    key = scene.as_pointer()
+    table = resolution_tables.get(key, None)
+    if table is not None and len(table.signature) != len(scene.timeline_markers):
+        del resolution_tables[key]
+    apply_marker_resolution(scene)
+
+
+@bpy.app.handlers.persistent
+def on_render_init(scene: bpy.types.Scene, *args) -> None:
+    # Blender reads the render size right after this handler and before `render_pre`,
+    # so this is the last chance to change the resolution of the render which is starting.
+    # Editing timeline markers does not always tag the scene in depsgraph,
+    # so make sure the table is not outdated before rendering.
+    key = scene.as_pointer()
+    table = resolution_tables.get(key, None)
+    if table is not None and table.signature != get_marker_signature(scene):
+        del resolution_tables[key]
+    apply_marker_resolution(scene)
+
+
+@bpy.app.handlers.persistent
+def on_depsgraph_update_post(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> None:
+    # Nothing to invalidate
+    if len(resolution_tables) == 0:
+        return
+
+    for update in depsgraph.updates:
+        updated_id = update.id
+        if isinstance(updated_id, bpy.types.Camera):
+            # Camera data changed, e.g. re-imported with another image.
+            resolution_tables.clear()
+            return
+        elif isinstance(updated_id, bpy.types.Object) and updated_id.type == 'CAMERA':
+            # Camera object changed, e.g. renamed or hidden from render.
+            resolution_tables.clear()
+            return
+        elif isinstance(updated_id, bpy.types.Scene):
+            # Scene changes also include render resolution written by ourselves,
+            # so only drop its table if markers are really changed.
+            original_scene = typing.cast(bpy.types.Scene, updated_id.original)
+            key = original_scene.as_pointer()
+            table = resolution_tables.get(key, None)
+            if table is not None and table.signature != get_marker_signature(original_scene):
+                del resolution_tables[key]
+
+
+@bpy.app.handlers.persistent
+def on_load_post(*args) -> None:
+    # Scene pointers are invalid after loading another file.
+    resolution_tables.clear()
+    # Message bus subscriptions are cleared when loading another file.
+    subscribe_marker_changes()
+
+
+def register():
+    subscribe_marker_changes()
+    bpy.app.handlers.frame_change_pre.append(on_frame_change_pre)
+    bpy.app.handlers.render_init.append(on_render_init)
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update_post)
+    bpy.app.handlers.load_post.append(on_load_post)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(on_load_post)
+    bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update_post)
+    bpy.app.handlers.render_init.remove(on_render_init)
+    bpy.app.handlers.frame_change_pre.remove(on_frame_change_pre)
+    bpy.msgbus.clear_by_owner(msgbus_owner)
+    resolution_tables.clear()
@@ -18,9 +18,11 @@ import bpy
 import mathutils
 import bpy_extras.io_utils
 import tempfile
+import hashlib
 import pathlib
 import typing
 from . import fspy
+from . import fspy_utils
 from . import fspy_properties
 
 class FSPYBLD_OT_import_fspy(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
@@ -61,13 +63,14 @@ class FSPYBLD_OT_import_fspy(bpy.types.Operator, bpy_extras.io_utils.ImportHelpe
 
         # Perform importing
         camera = find_or_create_camera(project, self.update_existing_camera)
-        setup_camera(project, camera)
-        set_render_resolution(project)
-        setup_3d_area(project, camera, self.update_existing_camera, self.import_background_image)
-        set_reference_distance_unit(project, camera)
+        summary = setup_camera(project, camera)
+        summary.update(set_render_resolution(project))
+        summary.update(setup_3d_area(project, camera, self.update_existing_camera, self.import_background_image))
+        summary.update(apply_unit_settings(project.reference_distance_unit))
 
         # Show finish message
-        self.report({'INFO'}, f'Finished setting up camera "{project.file_name}"')
+        self.report({'INFO'}, f'Finished setting up camera "{project.file_name}": '
+                    f'{len(summary.changed_fields)} properties changed, {summary.skipped_writes} writes skipped')
         return {'FINISHED'}
 
 
@@ -75,6 +78,35 @@ class ImporterError(Exception):
     pass
 
 
+class WriteSummary:
+    """
+    The summary of property writes performed by apply functions.
+    """
+    changed_fields: list[str]
+    skipped_writes: int
+
+    def __init__(self) -> None:
+        self.changed_fields = []
+        self.skipped_writes = 0
+
+    def update(self, other: 'WriteSummary') -> None:
+        self.changed_fields.extend(other.changed_fields)
+        self.skipped_writes += other.skipped_writes
+
+
+def write_property(summary: WriteSummary, owner: typing.Any, attr: str,
+                   value: typing.Any, field_name: str) -> None:
+    """
+    Write given value into property of owner only if it differs from current one,
+    and record this in summary.
+    """
+    if fspy_utils.is_close(getattr(owner, attr), value):
+        summary.skipped_writes += 1
+    else:
+        setattr(owner, attr, value)
+        summary.changed_fields.append(field_name)
+
+
 def add_into_scene(instance: bpy.types.Object) -> None:
     """
     Add given Blender object into active scene.
@@ -127,62 +159,109 @@ def find_or_create_camera(project: fspy.Project, update_existing_camera: bool) -
     return camera_object
 
 
-def setup_camera(project: fspy.Project, camera: bpy.types.Object) -> None:
+def setup_camera(project: fspy.Project, camera: bpy.types.Object) -> WriteSummary:
     """
-    Set camera parameters
+    Store the calibration of fSpy project on camera and apply it.
     """
+    summary = WriteSummary()
     camera_parameters = project.camera_parameters
     camera_data = typing.cast(bpy.types.Camera, camera.data)
 
-    # Set field of view
-    camera_data.type = 'PERSP'
-    camera_data.lens_unit = 'FOV'
-    camera_data.angle = camera_parameters.fov_horiz
+    camera_properties = fspy_properties.FspyProperties()
+    camera_properties.fspy_imported = True
+    camera_properties.image_resolution = (
+        camera_parameters.image_width,
+        camera_parameters.image_height
+    )
+    camera_properties.calibration_stored = True
+    camera_properties.principal_point = camera_parameters.principal_point
+    camera_properties.fov_horiz = camera_parameters.fov_horiz
+    camera_properties.camera_transform = camera_parameters.camera_transfrom
+    camera_properties.reference_distance_unit = project.reference_distance_unit
+    camera_properties.source_path = project.file_path
+    camera_properties.image_digest = hashlib.sha256(project.image_data).hexdigest()
+
+    # Only store properties which are changed.
+    properties = fspy_properties.get_inner_fspy_properties(camera_data)
+    for (name, value) in fspy_properties.get_inner_values(camera_properties).items():
+        write_property(summary, properties, name, value, f'fspy.{name}')
+
+    summary.update(apply_camera_calibration(camera_properties, camera))
+    return summary
+
 
-    # Set camera transform
-    camera.matrix_world = mathutils.Matrix(camera_parameters.camera_transfrom)
+def apply_camera_calibration(camera_properties: fspy_properties.FspyProperties,
+                             camera: bpy.types.Object) -> WriteSummary:
+    """
+    Set camera parameters from given calibration
+    """
+    summary = WriteSummary()
+    camera_data = typing.cast(bpy.types.Camera, camera.data)
+    (image_width, image_height) = camera_properties.image_resolution
+
+    # Set field of view
+    write_property(summary, camera_data, 'type', 'PERSP', 'camera.type')
+    write_property(summary, camera_data, 'lens_unit', 'FOV', 'camera.lens_unit')
+    write_property(summary, camera_data, 'angle', camera_properties.fov_horiz, 'camera.angle')
+
+    # Set camera transform,
+    # with its location scaled to match the reference distance unit.
+    matrix_world = mathutils.Matrix(camera_properties.camera_transform)
+    (_, _, _, camera_distance_scale) = get_unit_settings(camera_properties.reference_distance_unit)
+    matrix_world.translation *= camera_distance_scale
+    # `matrix_world` is only refreshed when depsgraph is evaluated,
+    # so it may be stale if camera has been moved by script.
+    # Compare with `matrix_basis` instead if it is the same as `matrix_world`,
+    # otherwise update view layer before comparing.
+    if camera.parent is None and len(camera.constraints) == 0:
+        write_property(summary, camera, 'matrix_basis', matrix_world, 'object.matrix_world')
+    else:
+        bpy.context.view_layer.update()
+        write_property(summary, camera, 'matrix_world', matrix_world, 'object.matrix_world')
 
     # Set camera shift (aka principal point)
     x_shift_scale = 1
     y_shift_scale = 1
-    if camera_parameters.image_height > camera_parameters.image_width:
-        x_shift_scale = camera_parameters.image_width / camera_parameters.image_height
+    if image_height > image_width:
+        x_shift_scale = image_width / image_height
     else:
-        y_shift_scale = camera_parameters.image_height / camera_parameters.image_width
+        y_shift_scale = image_height / image_width
 
-    pp = camera_parameters.principal_point
+    pp = camera_properties.principal_point
     pp_rel: tuple[float, float] = (0, 0)
-    image_aspect: float = camera_parameters.image_width / camera_parameters.image_height
+    image_aspect: float = image_width / image_height
     if image_aspect <= 1:
         pp_rel = (0.5 * (pp[0] / image_aspect + 1), 0.5 * (-pp[1] + 1))
     else:
         pp_rel = (0.5 * (pp[0] + 1), 0.5 * (-pp[1] * image_aspect + 1))
-    camera_data.shift_x = x_shift_scale * (0.5 - pp_rel[0])
-    camera_data.shift_y = y_shift_scale * (-0.5 + pp_rel[1])
+    write_property(summary, camera_data, 'shift_x', x_shift_scale * (0.5 - pp_rel[0]), 'camera.shift_x')
+    write_property(summary, camera_data, 'shift_y', y_shift_scale * (-0.5 + pp_rel[1]), 'camera.shift_y')
 
-    camera_properties = fspy_properties.FspyProperties()
-    camera_properties.fspy_imported = True
-    camera_properties.image_resolution = (
-        camera_parameters.image_width,
-        camera_parameters.image_height
-    )
-    fspy_properties.set_fspy_properties(camera_data, camera_properties)
+    return summary
 
 
-def set_render_resolution(project: fspy.Project) -> None:
+def set_render_resolution(project: fspy.Project) -> WriteSummary:
     """
     Sets the render resolution to match the project image
     """
+    summary = WriteSummary()
     render_settings = bpy.context.scene.render
-    render_settings.resolution_x = project.camera_parameters.image_width
-    render_settings.resolution_y = project.camera_parameters.image_height
+    write_property(summary, render_settings, 'resolution_x',
+                   project.camera_parameters.image_width, 'render.resolution_x')
+    write_property(summary, render_settings, 'resolution_y',
+                   project.camera_parameters.image_height, 'render.resolution_y')
+    return summary
 
 
 def find_or_create_image(
         project: fspy.Project, bg_images: bpy.types.CameraBackgroundImages,
-        update_existing_camera: bool) -> bpy.types.CameraBackgroundImage:
+        update_existing_camera: bool,
+        image_digest: str) -> bpy.types.CameraBackgroundImage:
     """
     Find or create new image slot for camera background images.
+
+    If the packed data of found image matches given digest, the image is kept as it is,
+    otherwise it is removed and the slot is left empty.
     """
     # Find existing image in background image collection.
     image_name = project.file_name
@@ -196,9 +275,10 @@ def find_or_create_image(
                 continue
             if inner.name == image_name:
                 # We found image we expected.
-                # Clear its associated image so that we can have a new image with same name.
-                bg_image.image = None
-                bpy.data.images.remove(inner)
+                if not is_same_image_data(inner, project, image_digest):
+                    # Clear its associated image so that we can have a new image with same name.
+                    bg_image.image = None
+                    bpy.data.images.remove(inner)
                 # And set it for return value.
                 existing_bg_image = bg_image
                 break
@@ -210,6 +290,20 @@ def find_or_create_image(
     return existing_bg_image
 
 
+def is_same_image_data(image: bpy.types.Image, project: fspy.Project, image_digest: str) -> bool:
+    """
+    Check whether the packed data of given image is the image data of fSpy project,
+    whose digest is given.
+    """
+    packed_file = image.packed_file
+    if packed_file is None:
+        return False
+    # Compare size first to avoid hashing in most of different cases.
+    if packed_file.size != len(project.image_data):
+        return False
+    return hashlib.sha256(packed_file.data).hexdigest() == image_digest
+
+
 def load_fspy_image_data(project: fspy.Project) -> bpy.types.Image:
     """
     Load fSpy project file stored image data into Blender safely.
@@ -233,7 +327,15 @@ def load_fspy_image_data(project: fspy.Project) -> bpy.types.Image:
 
 def setup_3d_area(project: fspy.Project, camera: bpy.types.Object,
                   update_existing_camera: bool,
-                  import_background_image: bool) -> None:
+                  import_background_image: bool) -> WriteSummary:
+    """
+    Show the camera and its background image in the first 3D view.
+
+    If existing background image has the same data as the project image,
+    it will be reused instead of being loaded again.
+    """
+    summary = WriteSummary()
+
     # Find the first 3D view area and set its background image
     def find_first_3d_view_area() -> bpy.types.SpaceView3D | None:
         for area in bpy.context.screen.areas:
@@ -242,46 +344,58 @@ def setup_3d_area(project: fspy.Project, camera: bpy.types.Object,
         return None
 
     space_data = find_first_3d_view_area()
-    if space_data is None: return
+    if space_data is None: return summary
     camera_data = typing.cast(bpy.types.Camera, camera.data)
 
     # Show background images
-    camera_data.show_background_images = True
+    write_property(summary, camera_data, 'show_background_images', True, 'camera.show_background_images')
 
     # Make the calibrated camera the active camera
-    space_data.camera = camera
-    space_data.region_3d.view_perspective = 'CAMERA'
+    if space_data.camera == camera:
+        summary.skipped_writes += 1
+    else:
+        space_data.camera = camera
+        summary.changed_fields.append('view3d.camera')
+    write_property(summary, space_data.region_3d, 'view_perspective', 'CAMERA', 'view3d.view_perspective')
 
     # Set camera background image
     if import_background_image:
         # Get background image slots
         bg_images = camera_data.background_images
 
-        # Setting background image has been requested.
-        # First, hide all existing bg images
-        for bg_image in bg_images:
-            bg_image.show_background_image = False
-
         # Try to find an existing bg image slot matching the project name
         # or create new one if necessary
-        bg_image = find_or_create_image(project, bg_images, update_existing_camera)
+        # The digest of project image has been stored by `setup_camera`.
+        image_digest = fspy_properties.get_inner_fspy_properties(camera_data).image_digest
+        bg_image = find_or_create_image(project, bg_images, update_existing_camera, image_digest)
 
-        # Make sure the background image slot is visible
-        bg_image.show_background_image = True
-
-        # Load project image into background
-        bg_image.image = load_fspy_image_data(project)
+        # Setting background image has been requested.
+        # Make sure only that slot is visible.
+        for (index, slot) in enumerate(bg_images):
+            write_property(summary, slot, 'show_background_image', slot == bg_image,
+                           f'camera.background_images[{index}].show_background_image')
+
+        # Load project image into background if it is not reused
+        if bg_image.image is None:
+            bg_image.image = load_fspy_image_data(project)
+            summary.changed_fields.append('camera.background_image')
+        else:
+            summary.skipped_writes += 1
 
+    return summary
 
-def set_reference_distance_unit(project: fspy.Project,
-                                camera: bpy.types.Object) -> None:
-    scene = bpy.context.scene
-    unit_settings = scene.unit_settings
 
+def get_unit_settings(
+        reference_distance_unit: fspy.ReferenceDistanceUnit
+) -> tuple[str, str | None, float, float]:
+    """
+    Get the Blender unit system, length unit, scale length
+    and camera distance scale matching given fSpy reference distance unit.
+    """
     is_imperial = False
     blender_unit = None
     scale_length = None
-    match project.reference_distance_unit:
+    match reference_distance_unit:
         case fspy.ReferenceDistanceUnit.MILLIMETERS:
             blender_unit = 'MILLIMETERS'
             scale_length = 0.001
@@ -307,19 +421,27 @@ def set_reference_distance_unit(project: fspy.Project,
             scale_length = 5280.0
             is_imperial = True
 
-    if blender_unit is not None:
-        camera_distance_scale = 1.0
-        if is_imperial:
-            camera_distance_scale = 1.0 / 3.2808399
-            unit_settings.system = 'IMPERIAL'
-        else:
-            unit_settings.system = 'METRIC'
-        unit_settings.length_unit = blender_unit
-        unit_settings.scale_length = scale_length
-        camera.location *= camera_distance_scale
+    if blender_unit is None or scale_length is None:
+        return ('NONE', None, 1.0, 1.0)
+    if is_imperial:
+        return ('IMPERIAL', blender_unit, scale_length, 1.0 / 3.2808399)
     else:
-        unit_settings.system = 'NONE'
-        unit_settings.scale_length = 1.0
+        return ('METRIC', blender_unit, scale_length, 1.0)
+
+
+def apply_unit_settings(reference_distance_unit: fspy.ReferenceDistanceUnit) -> WriteSummary:
+    """
+    Set the unit settings of active scene to match given fSpy reference distance unit.
+    """
+    summary = WriteSummary()
+    unit_settings = bpy.context.scene.unit_settings
+    (system, length_unit, scale_length, _) = get_unit_settings(reference_distance_unit)
+
+    write_property(summary, unit_settings, 'system', system, 'unit_settings.system')
+    if length_unit is not None:
+        write_property(summary, unit_settings, 'length_unit', length_unit, 'unit_settings.length_unit')
+    write_property(summary, unit_settings, 'scale_length', scale_length, 'unit_settings.scale_length')
+    return summary
 
 def register():
     bpy.utils.register_class(FSPYBLD_OT_import_fspy)
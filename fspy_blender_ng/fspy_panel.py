@@ -17,6 +17,7 @@
 import bpy
 import typing
 from . import fspy_properties
+from . import fspy_importer
 
 
 def is_valid_camera(context: bpy.types.Context) -> bool:
@@ -32,6 +33,19 @@ def is_valid_camera(context: bpy.types.Context) -> bool:
     return True
 
 
+def is_calibrated_camera(context: bpy.types.Context) -> bool:
+    # Check whether this is a valid fSpy camera first.
+    if not is_valid_camera(context):
+        return False
+    # Check whether full calibration is stored on this camera.
+    camera = typing.cast(bpy.types.Camera, context.camera)
+    camera_properties = fspy_properties.get_inner_fspy_properties(camera)
+    if not camera_properties.calibration_stored:
+        return False
+    # Okey
+    return True
+
+
 class FSPYBLD_PT_fspy_properties(bpy.types.Panel):
     bl_label = "fSpy"
     bl_idname = "FSPYBLD_PT_fspy_properties"
@@ -48,14 +62,23 @@ class FSPYBLD_PT_fspy_properties(bpy.types.Panel):
 
         # Show operators
         layout.operator(FSPYBLD_OT_set_render_resolution.bl_idname)
+        layout.operator(FSPYBLD_OT_reset_calibration.bl_idname)
+        layout.operator(FSPYBLD_OT_reapply_units.bl_idname)
+        scene_properties = fspy_properties.get_fspy_scene_properties(context.scene)
+        layout.prop(scene_properties, 'auto_render_resolution')
 
         # Show parameters
-        layout = layout.row()
+        layout = layout.column()
         layout.enabled = False
         layout.use_property_split = True
         camera = typing.cast(bpy.types.Camera, context.camera)
         camera_properties = fspy_properties.get_inner_fspy_properties(camera)
         layout.prop(camera_properties, 'image_resolution')
+        if camera_properties.calibration_stored:
+            layout.prop(camera_properties, 'fov_horiz')
+            layout.prop(camera_properties, 'principal_point')
+            layout.prop(camera_properties, 'reference_distance_unit')
+            layout.prop(camera_properties, 'source_path')
 
 
 class FSPYBLD_OT_set_render_resolution(bpy.types.Operator):
@@ -79,11 +102,58 @@ class FSPYBLD_OT_set_render_resolution(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class FSPYBLD_OT_reset_calibration(bpy.types.Operator):
+    """Restore the parameters and transform of this camera to the calibration stored when it was imported from fSpy."""
+    bl_idname = "fspybld.reset_calibration"
+    bl_label = "Reset to fSpy Calibration"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        if not is_calibrated_camera(context):
+            return False
+        # We need the object owning this camera data to restore its transform.
+        camera_object = context.object
+        return camera_object is not None and camera_object.data == context.camera
+
+    def execute(self, context):
+        camera_object = typing.cast(bpy.types.Object, context.object)
+        camera = typing.cast(bpy.types.Camera, context.camera)
+        camera_properties = fspy_properties.get_fspy_properties(camera)
+
+        summary = fspy_importer.apply_camera_calibration(camera_properties, camera_object)
+        self.report({'INFO'}, f'{len(summary.changed_fields)} properties restored')
+        return {'FINISHED'}
+
+
+class FSPYBLD_OT_reapply_units(bpy.types.Operator):
+    """Set the unit settings of the scene to the reference distance unit that was used in fSpy for this camera."""
+    bl_idname = "fspybld.reapply_units"
+    bl_label = "Re-apply Units"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return is_calibrated_camera(context)
+
+    def execute(self, context):
+        camera = typing.cast(bpy.types.Camera, context.camera)
+        camera_properties = fspy_properties.get_fspy_properties(camera)
+
+        summary = fspy_importer.apply_unit_settings(camera_properties.reference_distance_unit)
+        self.report({'INFO'}, f'{len(summary.changed_fields)} unit settings changed')
+        return {'FINISHED'}
+
+
 def register():
     bpy.utils.register_class(FSPYBLD_OT_set_render_resolution)
+    bpy.utils.register_class(FSPYBLD_OT_reset_calibration)
+    bpy.utils.register_class(FSPYBLD_OT_reapply_units)
     bpy.utils.register_class(FSPYBLD_PT_fspy_properties)
 
 
 def unregister():
     bpy.utils.unregister_class(FSPYBLD_PT_fspy_properties)
+    bpy.utils.unregister_class(FSPYBLD_OT_reapply_units)
+    bpy.utils.unregister_class(FSPYBLD_OT_reset_calibration)
     bpy.utils.unregister_class(FSPYBLD_OT_set_render_resolution)
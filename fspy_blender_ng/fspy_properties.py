@@ -16,6 +16,7 @@
 
 import bpy
 import typing
+from . import fspy
 
 FSPY_PROPERTIES_NAME: str = 'fspy'
 
@@ -23,10 +24,29 @@ FSPY_PROPERTIES_NAME: str = 'fspy'
 class FspyProperties:
     fspy_imported: bool
     image_resolution: tuple[int, int]
+    calibration_stored: bool
+    principal_point: tuple[float, float]
+    fov_horiz: float
+    camera_transform: fspy.TransformMatrix
+    reference_distance_unit: fspy.ReferenceDistanceUnit
+    source_path: str
+    image_digest: str
 
     def __init__(self) -> None:
         self.fspy_imported = False
         self.image_resolution = (0, 0)
+        self.calibration_stored = False
+        self.principal_point = (0.0, 0.0)
+        self.fov_horiz = 0.0
+        self.camera_transform = (
+            (1.0, 0.0, 0.0, 0.0),
+            (0.0, 1.0, 0.0, 0.0),
+            (0.0, 0.0, 1.0, 0.0),
+            (0.0, 0.0, 0.0, 1.0),
+        )
+        self.reference_distance_unit = fspy.ReferenceDistanceUnit.METERS
+        self.source_path = ''
+        self.image_digest = ''
 
 
 class FSPYBLD_PG_fspy_properties(bpy.types.PropertyGroup):
@@ -46,6 +66,68 @@ class FSPYBLD_PG_fspy_properties(bpy.types.PropertyGroup):
         min=0,
     )  # type: ignore
 
+    calibration_stored: bpy.props.BoolProperty(
+        name="Calibration Stored",
+        description=
+        "True if the full fSpy calibration is stored on this camera, so that it can be restored without the project file.",
+        default=False,
+    )  # type: ignore
+
+    principal_point: bpy.props.FloatVectorProperty(
+        name="Principal Point",
+        description=
+        "The principal point solved by fSpy, in relative image coordinates",
+        size=2,
+        default=(0.0, 0.0),
+    )  # type: ignore
+
+    fov_horiz: bpy.props.FloatProperty(
+        name="Horizontal FOV",
+        description="The horizontal field of view solved by fSpy",
+        subtype='ANGLE',
+        default=0.0,
+    )  # type: ignore
+
+    camera_transform: bpy.props.FloatVectorProperty(
+        name="Camera Transform",
+        description=
+        "The 4x4 camera transform solved by fSpy, flattened in row-major order",
+        size=16,
+        default=(1.0, 0.0, 0.0, 0.0,
+                 0.0, 1.0, 0.0, 0.0,
+                 0.0, 0.0, 1.0, 0.0,
+                 0.0, 0.0, 0.0, 1.0),
+    )  # type: ignore
+
+    reference_distance_unit: bpy.props.EnumProperty(
+        name="Reference Unit",
+        description="The reference distance unit used in fSpy",
+        items=[(unit.name, unit.value, '') for unit in fspy.ReferenceDistanceUnit],
+        default=fspy.ReferenceDistanceUnit.METERS.name,
+    )  # type: ignore
+
+    source_path: bpy.props.StringProperty(
+        name="Source Path",
+        description="The path of the fSpy project file this camera was imported from",
+        subtype='FILE_PATH',
+        default='',
+    )  # type: ignore
+
+    image_digest: bpy.props.StringProperty(
+        name="Image Digest",
+        description="The SHA-256 digest of the reference image stored in the fSpy project file",
+        default='',
+    )  # type: ignore
+
+
+class FSPYBLD_PG_fspy_scene_properties(bpy.types.PropertyGroup):
+    auto_render_resolution: bpy.props.BoolProperty(
+        name="Auto Render Resolution",
+        description=
+        "Set the render resolution to the reference image resolution whenever timeline markers switch the scene camera to an fSpy camera",
+        default=False,
+    )  # type: ignore
+
 
 def get_inner_fspy_properties(
         camera: bpy.types.Camera) -> FSPYBLD_PG_fspy_properties:
@@ -62,24 +144,66 @@ def get_fspy_properties(camera: bpy.types.Camera) -> FspyProperties:
         properties.image_resolution[0],
         properties.image_resolution[1],
     )
+    rv.calibration_stored = properties.calibration_stored
+    rv.principal_point = (
+        properties.principal_point[0],
+        properties.principal_point[1],
+    )
+    rv.fov_horiz = properties.fov_horiz
+    flat_transform = tuple(properties.camera_transform)
+    rv.camera_transform = tuple(
+        flat_transform[i:i + 4] for i in range(0, 16, 4))  # type: ignore
+    rv.reference_distance_unit = fspy.ReferenceDistanceUnit[
+        properties.reference_distance_unit]
+    rv.source_path = properties.source_path
+    rv.image_digest = properties.image_digest
 
     return rv
 
 
+def get_inner_values(data: FspyProperties) -> dict[str, typing.Any]:
+    """
+    Convert given data into the values stored in property group, keyed by property name.
+    """
+    return {
+        'fspy_imported': data.fspy_imported,
+        'image_resolution': data.image_resolution,
+        'calibration_stored': data.calibration_stored,
+        'principal_point': data.principal_point,
+        'fov_horiz': data.fov_horiz,
+        'camera_transform': tuple(
+            value for row in data.camera_transform for value in row),
+        'reference_distance_unit': data.reference_distance_unit.name,
+        'source_path': data.source_path,
+        'image_digest': data.image_digest,
+    }
+
+
 def set_fspy_properties(camera: bpy.types.Camera,
                         data: FspyProperties) -> None:
     properties = get_inner_fspy_properties(camera)
 
-    properties.fspy_imported = data.fspy_imported
-    properties.image_resolution = data.image_resolution
+    for (name, value) in get_inner_values(data).items():
+        setattr(properties, name, value)
+
+
+def get_fspy_scene_properties(
+        scene: bpy.types.Scene) -> FSPYBLD_PG_fspy_scene_properties:
+    return typing.cast(FSPYBLD_PG_fspy_scene_properties,
+                       getattr(scene, FSPY_PROPERTIES_NAME))
 
 
 def register():
     bpy.utils.register_class(FSPYBLD_PG_fspy_properties)
+    bpy.utils.register_class(FSPYBLD_PG_fspy_scene_properties)
     setattr(bpy.types.Camera, FSPY_PROPERTIES_NAME,
             bpy.props.PointerProperty(type=FSPYBLD_PG_fspy_properties))
+    setattr(bpy.types.Scene, FSPY_PROPERTIES_NAME,
+            bpy.props.PointerProperty(type=FSPYBLD_PG_fspy_scene_properties))
 
 
 def unregister():
+    delattr(bpy.types.Scene, FSPY_PROPERTIES_NAME)
     delattr(bpy.types.Camera, FSPY_PROPERTIES_NAME)
+    bpy.utils.unregister_class(FSPYBLD_PG_fspy_scene_properties)
     bpy.utils.unregister_class(FSPYBLD_PG_fspy_properties)
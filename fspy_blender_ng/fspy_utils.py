@@ -0,0 +1,85 @@
+# fSpy Blender Importer
+# Copyright (C) 2018-2025 Per Gantelius, yyc12345
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import bisect
+import math
+import enum
+import typing
+
+T = typing.TypeVar('T')
+
+
+class CameraSwitchTable(typing.Generic[T]):
+    """
+    The values bound to timeline camera markers, sorted by marker frame.
+    Looking up follows the rules which Blender uses to switch scene camera by markers.
+    """
+    frames: list[int]
+    values: list[T]
+
+    def __init__(self, markers: typing.Iterable[tuple[int, T, bool]]) -> None:
+        """
+        Each marker is given as its frame, its bound value, and whether it can switch camera,
+        i.e. it has a camera which is not hidden from render.
+        Markers should be given in their listed order.
+        """
+        self.frames = []
+        self.values = []
+
+        # Blender ignores markers which can not switch camera.
+        switchable_markers = [(frame, value) for (frame, value, switchable) in markers if switchable]
+
+        # Sort them by frame. Sorting is stable, and Blender picks the first listed marker
+        # if there are multiple markers at the same frame, so only keep the first one.
+        switchable_markers.sort(key=lambda v: v[0])
+        for (frame, value) in switchable_markers:
+            if len(self.frames) != 0 and self.frames[-1] == frame:
+                continue
+            self.frames.append(frame)
+            self.values.append(value)
+
+    def lookup(self, frame: int) -> T | None:
+        """
+        Get the value bound to the marker picked at given frame, or `None` if there is no such marker.
+        """
+        if len(self.frames) == 0:
+            return None
+        # Pick the last marker not after given frame.
+        # If there is no such marker, Blender picks the first marker.
+        index = bisect.bisect_right(self.frames, frame) - 1
+        if index < 0:
+            index = 0
+        return self.values[index]
+
+
+FLOAT_TOLERANCE: float = 1e-6
+
+
+def is_close(current: typing.Any, expected: typing.Any) -> bool:
+    """
+    Check whether given values are equal, with tolerance for floats.
+    Vectors, matrices and other sequences are compared element-wise.
+    """
+    if isinstance(current, float) or isinstance(expected, float):
+        return math.isclose(current, expected, rel_tol=FLOAT_TOLERANCE, abs_tol=FLOAT_TOLERANCE)
+    if isinstance(current, (str, int, enum.Enum)) or current is None:
+        return current == expected
+    # Sequence-like values, such as tuple, Vector, Matrix and Blender property array.
+    current_items = tuple(current)
+    expected_items = tuple(expected)
+    if len(current_items) != len(expected_items):
+        return False
+    return all(is_close(c, e) for (c, e) in zip(current_items, expected_items))
@@ -8,6 +8,12 @@ fspy_spec = importlib.util.spec_from_file_location("fspy", fspy_path)
 fspy = importlib.util.module_from_spec(fspy_spec)
 fspy_spec.loader.exec_module(fspy)
 
+# Load fSpy utilities in the same way.
+fspy_utils_path = pathlib.Path(__file__).resolve().parent.parent / 'fspy_blender_ng' / 'fspy_utils.py'
+fspy_utils_spec = importlib.util.spec_from_file_location("fspy_utils", fspy_utils_path)
+fspy_utils = importlib.util.module_from_spec(fspy_utils_spec)
+fspy_utils_spec.loader.exec_module(fspy_utils)
+
 def get_test_data(file_name: str) -> str:
     """Helper to get the path of test assets"""
     return pathlib.Path(__file__).parent / file_name
@@ -19,6 +25,14 @@ class TestfSpyProjectLoading(unittest.TestCase):
         """
         fspy.Project(get_test_data('canon5d_16mm.fspy'))
 
+    def test_project_file_path(self):
+        """
+        Loaded project should remember the absolute path of its file
+        """
+        project = fspy.Project(get_test_data('shifted_landscape.fspy'))
+        self.assertEqual(project.file_name, 'shifted_landscape.fspy')
+        self.assertEqual(pathlib.Path(project.file_path), get_test_data('shifted_landscape.fspy').absolute())
+
     def test_wrong_project_version(self):
         """
         Opening projects with an unsupported binary version should fail
@@ -33,5 +47,77 @@ class TestfSpyProjectLoading(unittest.TestCase):
         with self.assertRaises(fspy.ParseError):
             fspy.Project(get_test_data('json_export.json'))
 
+class TestCameraSwitchTable(unittest.TestCase):
+    def test_empty_table(self):
+        """
+        Looking up a table without switchable markers should give nothing
+        """
+        table = fspy_utils.CameraSwitchTable([(1, 'a', False)])
+        self.assertIsNone(table.lookup(1))
+
+    def test_last_marker_not_after_frame(self):
+        """
+        The last marker at or before given frame should be picked
+        """
+        table = fspy_utils.CameraSwitchTable([(10, 'b', True), (1, 'a', True), (20, 'c', True)])
+        self.assertEqual(table.lookup(1), 'a')
+        self.assertEqual(table.lookup(9), 'a')
+        self.assertEqual(table.lookup(10), 'b')
+        self.assertEqual(table.lookup(100), 'c')
+
+    def test_first_marker_before_any(self):
+        """
+        The first marker should be picked for frames before any marker
+        """
+        table = fspy_utils.CameraSwitchTable([(10, 'b', True), (5, 'a', True)])
+        self.assertEqual(table.lookup(-3), 'a')
+
+    def test_first_listed_marker_on_same_frame(self):
+        """
+        The first listed marker should be picked if there are multiple markers at the same frame
+        """
+        table = fspy_utils.CameraSwitchTable([(5, 'a', True), (5, 'b', True)])
+        self.assertEqual(table.lookup(5), 'a')
+        self.assertEqual(table.lookup(0), 'a')
+
+    def test_skip_unswitchable_marker(self):
+        """
+        Markers which can not switch camera should be ignored
+        """
+        table = fspy_utils.CameraSwitchTable([(1, 'a', True), (5, 'hidden', False), (5, 'b', True)])
+        self.assertEqual(table.lookup(5), 'b')
+        table = fspy_utils.CameraSwitchTable([(0, 'hidden', False), (5, 'a', True)])
+        self.assertEqual(table.lookup(0), 'a')
+
+class TestIsClose(unittest.TestCase):
+    def test_float_tolerance(self):
+        """
+        Floats should be compared with tolerance
+        """
+        self.assertTrue(fspy_utils.is_close(1.0, 1.0 + 1e-9))
+        self.assertTrue(fspy_utils.is_close(1000.0, 1000.0001))
+        self.assertTrue(fspy_utils.is_close(0, 1e-9))
+        self.assertFalse(fspy_utils.is_close(1.0, 1.01))
+
+    def test_exact_values(self):
+        """
+        Strings, integers, booleans and enums should be compared exactly
+        """
+        self.assertTrue(fspy_utils.is_close('FOV', 'FOV'))
+        self.assertFalse(fspy_utils.is_close('FOV', 'MILLIMETERS'))
+        self.assertTrue(fspy_utils.is_close(1920, 1920))
+        self.assertFalse(fspy_utils.is_close(1920, 1921))
+        self.assertFalse(fspy_utils.is_close(True, False))
+        self.assertTrue(fspy_utils.is_close(fspy.ReferenceDistanceUnit.FEET, 'Feet'))
+
+    def test_sequences(self):
+        """
+        Sequences should be compared element-wise, including nested ones
+        """
+        self.assertTrue(fspy_utils.is_close((1, 2.0), [1, 2.0 + 1e-9]))
+        self.assertTrue(fspy_utils.is_close(((1.0, 0.0), (0.0, 1.0)), ((1.0, 1e-9), (0.0, 1.0))))
+        self.assertFalse(fspy_utils.is_close(((1.0, 0.0), (0.0, 1.0)), ((1.0, 0.1), (0.0, 1.0))))
+        self.assertFalse(fspy_utils.is_close((1, 2), (1, 2, 3)))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file